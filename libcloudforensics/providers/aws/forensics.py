@@ -15,6 +15,7 @@
 """Forensics on AWS."""
 from typing import TYPE_CHECKING, Tuple, List, Optional, Dict, Any
 
+import concurrent.futures
 import random
 from time import sleep
 from libcloudforensics.providers.aws.internal.common import ALINUX2_BASE_FILTER
@@ -200,6 +201,66 @@ def CreateVolumeCopy(zone: str,
 
   return new_volume
 
+
+# pylint: disable=too-many-arguments
+def CreateVolumeCopies(zone: str,
+                       volume_ids: List[str],
+                       dst_zone: Optional[str] = None,
+                       volume_type: Optional[str] = None,
+                       src_profile: Optional[str] = None,
+                       dst_profile: Optional[str] = None,
+                       tags: Optional[Dict[str, str]] = None
+                       ) -> List['ebs.AWSVolume']:
+  """Create copies of several AWS EBS Volumes, concurrently.
+
+  Each copy is an independent chain of snapshot / volume-creation calls
+  that spends most of its time waiting on AWS, so the copies are run on
+  worker threads and overlap instead of serializing. See CreateVolumeCopy
+  for the semantics of the individual copies and the remaining parameters.
+
+  Args:
+    zone (str): The AWS zone in which the volumes are located, e.g.
+        'us-east-2b'.
+    volume_ids (List[str]): IDs of the volumes to copy.
+    dst_zone (str): Optional. The AWS zone in which to create the volume
+        copies. By default, this is the same as 'zone'.
+    volume_type (str): Optional. The volume type for the volumes to be
+        created. Can be one of 'standard'|'io1'|'gp2'|'sc1'|'st1'. The default
+        behavior is to use the same volume type as the source volume.
+    src_profile (str): Optional. Name of the profile for the AWS account
+        containing the volumes to be copied.
+    dst_profile (str): Optional. Name of the profile for the AWS account in
+        which to create the volume copies.
+    tags (Dict[str, str]): Optional. A dictionary of tags to add to the
+          volume copies, for example {'TicketID': 'xxx'}.
+
+  Returns:
+    List[AWSVolume]: The volume copies, in the same order as volume_ids.
+
+  Raises:
+    ResourceCreationError: If any of the volumes could not be copied.
+    ValueError: If volume_ids is empty.
+  """
+
+  if not volume_ids:
+    raise ValueError('You must specify at least one volume ID.')
+
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=len(volume_ids)) as executor:
+    futures = [
+        executor.submit(
+            CreateVolumeCopy,
+            zone,
+            dst_zone=dst_zone,
+            volume_id=volume_id,
+            volume_type=volume_type,
+            src_profile=src_profile,
+            dst_profile=dst_profile,
+            tags=tags) for volume_id in volume_ids]
+    return [future.result() for future in futures]
+# pylint: enable=too-many-arguments
+
+
 # pylint: disable=too-many-arguments
 def StartAnalysisVm(
     vm_name: str,
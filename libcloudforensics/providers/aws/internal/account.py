@@ -18,8 +18,10 @@ Library to make forensic images of Amazon Elastic Block Store devices and create
 analysis virtual machine to be used in incident response.
 """
 
-from typing import Optional, TYPE_CHECKING
+import threading
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 import boto3
+import botocore.config
 
 from libcloudforensics.providers.aws.internal import ec2
 from libcloudforensics.providers.aws.internal import ebs
@@ -30,6 +32,15 @@ from libcloudforensics.providers.aws.internal import s3
 if TYPE_CHECKING:
   import botocore
 
+# Shared client configuration. Adaptive retries absorb API throttling, and
+# the larger connection pool keeps threaded describe calls (e.g. the
+# multi-region listing helpers) from serializing on the default pool of 10.
+# tcp_keepalive is deliberately not set: it needs botocore >= 1.27.84, which
+# is unavailable on the oldest supported Python versions.
+_BOTO_CONFIG = botocore.config.Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive'})
+
 
 class AWSAccount:
   """Class representing an AWS account.
@@ -41,6 +52,10 @@ class AWSAccount:
     aws_profile (str): The AWS profile defined in the AWS
         credentials file to use.
     session (boto3.session.Session): A boto3 session object.
+    _clients (Dict[Tuple[str, str], botocore.client.BaseClient]): Cache of
+        boto3 client objects, mapped by (service, region).
+    _resources (Dict[Tuple[str, str], boto3.resources.base.ServiceResource]):
+        Cache of boto3 resource objects, mapped by (service, region).
     _ec2 (AWSEC2): An AWS EC2 client object.
     _ebs (AWSEBS): An AWS EBS client object.
     _kms (AWSKMS): An AWS KMS client object.
@@ -87,6 +102,15 @@ class AWSAccount:
     else:
       self.session = boto3.session.Session()
 
+    # Creating boto3 clients/resources is expensive (credential resolution,
+    # endpoint discovery), so cache them per (service, region) and reuse them
+    # across calls. The lock serializes cache misses: creating clients from
+    # a shared boto3 session is not thread-safe, and the multi-region and
+    # batch helpers call in from worker threads.
+    self._clients = {}  # type: Dict[Tuple[str, str], Any]
+    self._resources = {}  # type: Dict[Tuple[str, str], Any]
+    self._client_creation_lock = threading.Lock()
+
     self._ec2 = None  # type: Optional[ec2.EC2]
     self._ebs = None  # type: Optional[ebs.EBS]
     self._kms = None  # type: Optional[kms.KMS]
@@ -172,10 +196,14 @@ class AWSAccount:
       botocore.client.EC2: An AWS EC2 client object.
     """
 
-    if region:
-      return self.session.client(service_name=service, region_name=region)
-    return self.session.client(
-        service_name=service, region_name=self.default_region)
+    region = region or self.default_region
+    client_key = (service, region)
+    if client_key not in self._clients:
+      with self._client_creation_lock:
+        if client_key not in self._clients:
+          self._clients[client_key] = self.session.client(
+              service_name=service, region_name=region, config=_BOTO_CONFIG)
+    return self._clients[client_key]
 
   def ResourceApi(self,
                   service: str,
@@ -196,7 +224,11 @@ class AWSAccount:
       boto3.resources.factory.ec2.ServiceResource: An AWS EC2 resource object.
     """
 
-    if region:
-      return self.session.resource(service_name=service, region_name=region)
-    return self.session.resource(
-        service_name=service, region_name=self.default_region)
+    region = region or self.default_region
+    resource_key = (service, region)
+    if resource_key not in self._resources:
+      with self._client_creation_lock:
+        if resource_key not in self._resources:
+          self._resources[resource_key] = self.session.resource(
+              service_name=service, region_name=region, config=_BOTO_CONFIG)
+    return self._resources[resource_key]
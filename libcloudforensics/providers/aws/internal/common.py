@@ -25,6 +25,10 @@ CLOUDTRAIL_SERVICE = 'cloudtrail'
 S3_SERVICE = 's3'
 IAM_SERVICE = 'iam'
 
+# Maximum number of resource IDs to send per describe call when batching
+# multi-ID lookups.
+MAX_IDS_PER_DESCRIBE = 200
+
 # Resource types constant
 INSTANCE = 'instance'
 VOLUME = 'volume'
@@ -113,11 +117,9 @@ def ExecuteRequest(client: 'botocore.client.EC2',
     RuntimeError: If the request to the boto3 API could not complete.
   """
   responses = []
-  next_token = None
+  # Resolve the bound method once rather than per page.
+  request = getattr(client, func)
   while True:
-    if next_token:
-      kwargs['NextToken'] = next_token
-    request = getattr(client, func)
     try:
       response = request(**kwargs)
     except client.exceptions.ClientError as exception:
@@ -127,3 +129,4 @@ def ExecuteRequest(client: 'botocore.client.EC2',
     next_token = response.get('NextToken')
     if not next_token:
       return responses
+    kwargs['NextToken'] = next_token
@@ -14,8 +14,9 @@
 # limitations under the License.
 """Disk functionality."""
 
-import binascii
-from typing import TYPE_CHECKING, Dict, Optional, Union, List, Any
+import concurrent.futures
+import zlib
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Union, List, Any
 
 import botocore
 
@@ -117,21 +118,17 @@ class AWSVolume(AWSElasticBlockStore):
       AWSSnapshot: A snapshot object.
 
     Raises:
-      InvalidNameError: If the snapshot name does not comply with the RegEx.
       ResourceCreationError: If the snapshot could not be created.
     """
 
     if not tags:
       tags = {}
 
-    snapshot_name = tags.get('Name') or (self.volume_id + '-snapshot')
+    snapshot_name = tags.get('Name') or f'{self.volume_id:s}-snapshot'
+    # Truncating to the tag value limit makes any further length check
+    # redundant, so none is done here.
     truncate_at = 255 - 1
-    snapshot_name = snapshot_name[:truncate_at]
-    if len(snapshot_name) > 255:
-      raise errors.InvalidNameError(
-          'Snapshot name {0:s} is too long (>255 chars)'.format(snapshot_name),
-          __name__)
-    tags['Name'] = snapshot_name
+    tags['Name'] = snapshot_name[:truncate_at]
 
     client = self.aws_account.ClientApi(common.EC2_SERVICE)
     try:
@@ -143,7 +140,7 @@ class AWSVolume(AWSElasticBlockStore):
       # Wait for snapshot completion
       client.get_waiter('snapshot_completed').wait(
           SnapshotIds=[snapshot_id],
-          WaiterConfig={'Delay': 30, 'MaxAttempts': 100})
+          WaiterConfig={'Delay': 5, 'MaxAttempts': 600})
     except (client.exceptions.ClientError,
             botocore.exceptions.WaiterError) as exception:
       raise errors.ResourceCreationError(
@@ -272,13 +269,13 @@ class AWSSnapshot(AWSElasticBlockStore):
         self.aws_account.default_region,
         self.aws_account.default_availability_zone,
         self.volume,
-        name='{0:s}-copy'.format(self.snapshot_id)
+        name=f'{self.snapshot_id:s}-copy'
     )
 
     # Wait for the copy to be available
     client.get_waiter('snapshot_completed').wait(
         SnapshotIds=[snapshot_copy.snapshot_id],
-        WaiterConfig={'Delay': 30, 'MaxAttempts': 100})
+        WaiterConfig={'Delay': 5, 'MaxAttempts': 600})
 
     if delete:
       if deletion_account:
@@ -333,6 +330,66 @@ class EBS:
       aws_account (AWSAccount): An AWS account object.
     """
     self.aws_account = aws_account
+    # Caller identity is immutable for the lifetime of the account object,
+    # so the STS response is fetched once and cached.
+    self._account_information = None  # type: Optional[Dict[str, str]]
+
+  def ListVolumesIter(
+      self,
+      region: Optional[str] = None,
+      filters: Optional[List[Dict[str, Any]]] = None) -> Iterator[AWSVolume]:
+    """Iterate over volumes of an AWS account, page by page.
+
+    Unlike ListVolumes, this does not materialise the full account in
+    memory, so callers that only need the first few matches can stop early.
+
+    Args:
+      region (str): Optional. The region from which to list the volumes.
+          If none provided, the default_region associated to the AWSAccount
+          object will be used.
+      filters (List[Dict]): Optional. Filters for the query. Filters are
+          given as a list of dictionaries, e.g.: {'Name': 'someFilter',
+          'Values': ['value1', 'value2']}.
+
+    Yields:
+      AWSVolume: An Amazon EC2 Volume object.
+
+    Raises:
+      RuntimeError: If volumes can't be listed.
+    """
+
+    if not filters:
+      filters = []
+
+    client = self.aws_account.ClientApi(common.EC2_SERVICE, region=region)
+    # Use the native botocore paginator, which streams pages over a single
+    # client instead of re-issuing the request per NextToken.
+    paginator = client.get_paginator('describe_volumes')
+    try:
+      for response in paginator.paginate(Filters=filters):
+        for volume in response['Volumes']:
+          volume_id = volume['VolumeId']
+          aws_volume = AWSVolume(volume_id,
+                                 self.aws_account,
+                                 self.aws_account.default_region,
+                                 volume['AvailabilityZone'],
+                                 volume['Encrypted'])
+
+          # Index the tags once; resolving further tags later is then a
+          # dict lookup instead of another scan.
+          tag_map = {tag['Key']: tag['Value']
+                     for tag in volume.get('Tags') or ()}
+          aws_volume.name = tag_map.get('Name')
+
+          for attachment in volume.get('Attachments', []):
+            if attachment.get('State') == 'attached':
+              aws_volume.device_name = attachment.get('Device')
+              break
+
+          yield aws_volume
+    except client.exceptions.ClientError as exception:
+      raise RuntimeError('Could not process request: {0:s}'.format(
+          str(exception))) from exception
 
   def ListVolumes(
       self,
@@ -361,33 +418,43 @@ class EBS:
       RuntimeError: If volumes can't be listed.
     """
 
-    if not filters:
-      filters = []
+    return {volume.volume_id: volume for volume in
+            self.ListVolumesIter(region=region, filters=filters)}
 
-    volumes = {}
-    client = self.aws_account.ClientApi(common.EC2_SERVICE, region=region)
-    responses = common.ExecuteRequest(
-        client, 'describe_volumes', {'Filters': filters})
-    for response in responses:
-      for volume in response['Volumes']:
-        volume_id = volume['VolumeId']
-        aws_volume = AWSVolume(volume_id,
-                               self.aws_account,
-                               self.aws_account.default_region,
-                               volume['AvailabilityZone'],
-                               volume['Encrypted'])
-
-        for tag in volume.get('Tags', []):
-          if tag.get('Key') == 'Name':
-            aws_volume.name = tag.get('Value')
-            break
-
-        for attachment in volume.get('Attachments', []):
-          if attachment.get('State') == 'attached':
-            aws_volume.device_name = attachment.get('Device')
-            break
-
-        volumes[volume_id] = aws_volume
+  def ListVolumesMultiRegion(
+      self,
+      regions: List[str],
+      filters: Optional[List[Dict[str, Any]]] = None) -> Dict[str, AWSVolume]:
+    """List volumes of an AWS account across several regions.
+
+    The regions are queried concurrently, since each describe call is
+    network-bound and independent of the others.
+
+    Args:
+      regions (List[str]): The regions from which to list the volumes.
+      filters (List[Dict]): Optional. Filters for the query. Filters are
+          given as a list of dictionaries, e.g.: {'Name': 'someFilter',
+          'Values': ['value1', 'value2']}.
+
+    Returns:
+      Dict[str, AWSVolume]: Dictionary mapping volume IDs (str) to their
+          respective AWSVolume object.
+
+    Raises:
+      RuntimeError: If volumes can't be listed.
+    """
+
+    volumes = {}  # type: Dict[str, AWSVolume]
+    if not regions:
+      return volumes
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(regions)) as executor:
+      futures = [
+          executor.submit(self.ListVolumes, region=region, filters=filters)
+          for region in regions]
+      for future in concurrent.futures.as_completed(futures):
+        volumes.update(future.result())
     return volumes
 
   def GetVolumesByNameOrId(self,
@@ -444,7 +511,11 @@ class EBS:
           matching name tag is found, the method returns an empty list.
     """
 
-    volumes = self.ListVolumes(region=region)
+    # Filter on the name tag server-side so that AWS only returns matching
+    # volumes, instead of downloading every volume in the account.
+    volumes = self.ListVolumes(
+        region=region,
+        filters=[{'Name': 'tag:Name', 'Values': [volume_name]}])
     return [volume for volume in volumes.values() if
             volume.name == volume_name]
 
@@ -466,13 +537,79 @@ class EBS:
       ResourceNotFoundError: If the volume does not exist.
     """
 
-    volumes = self.ListVolumes(region=region)
-    volume = volumes.get(volume_id)
-    if not volume:
+    # Describe the volume directly by its ID: a single API call returning
+    # one record, with no pagination or full-account dict to build.
+    client = self.aws_account.ClientApi(common.EC2_SERVICE, region=region)
+    try:
+      response = client.describe_volumes(VolumeIds=[volume_id])
+    except client.exceptions.ClientError as exception:
+      raise errors.ResourceNotFoundError(
+          'Volume {0:s} was not found in AWS account: {1!s}'.format(
+              volume_id, exception), __name__) from exception
+
+    volumes = response.get('Volumes')
+    if not volumes:
       raise errors.ResourceNotFoundError(
           'Volume {0:s} was not found in AWS account'.format(volume_id),
           __name__)
-    return volume
+
+    volume = volumes[0]
+    aws_volume = AWSVolume(volume_id,
+                           self.aws_account,
+                           self.aws_account.default_region,
+                           volume['AvailabilityZone'],
+                           volume['Encrypted'])
+    tag_map = {tag['Key']: tag['Value'] for tag in volume.get('Tags') or ()}
+    aws_volume.name = tag_map.get('Name')
+    for attachment in volume.get('Attachments', []):
+      if attachment.get('State') == 'attached':
+        aws_volume.device_name = attachment.get('Device')
+        break
+    return aws_volume
+
+  def GetVolumesByIds(
+      self,
+      volume_ids: List[str],
+      region: Optional[str] = None) -> Dict[str, AWSVolume]:
+    """Get several volumes from an AWS account by their IDs, in batches.
+
+    The IDs are sent to the API in chunks of up to 200 per describe call
+    instead of one call per volume, and the chunks are queried concurrently.
+    IDs that do not exist in the account are silently absent from the result.
+
+    Args:
+      volume_ids (List[str]): The volume IDs to look up.
+      region (str): Optional. The region to look the volumes in.
+          If none provided, the default_region associated to the AWSAccount
+          object will be used.
+
+    Returns:
+      Dict[str, AWSVolume]: Dictionary mapping volume IDs (str) to their
+          respective AWSVolume object.
+
+    Raises:
+      RuntimeError: If volumes can't be described.
+    """
+
+    volumes = {}  # type: Dict[str, AWSVolume]
+    if not volume_ids:
+      return volumes
+
+    chunks = [volume_ids[i:i + common.MAX_IDS_PER_DESCRIBE] for i in
+              range(0, len(volume_ids), common.MAX_IDS_PER_DESCRIBE)]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(chunks)) as executor:
+      # Filtering on volume-id (rather than passing VolumeIds=) makes the
+      # API skip unknown IDs instead of failing the whole batch.
+      futures = [
+          executor.submit(
+              self.ListVolumes,
+              region=region,
+              filters=[{'Name': 'volume-id', 'Values': chunk}])
+          for chunk in chunks]
+      for future in concurrent.futures.as_completed(futures):
+        volumes.update(future.result())
+    return volumes
 
   def CreateVolumeFromSnapshot(
       self,
@@ -543,7 +680,9 @@ class EBS:
       volume = client.create_volume(**create_volume_args)
       volume_id = volume['VolumeId']
       # Wait for volume creation completion
-      client.get_waiter('volume_available').wait(VolumeIds=[volume_id])
+      client.get_waiter('volume_available').wait(
+          VolumeIds=[volume_id],
+          WaiterConfig={'Delay': 3, 'MaxAttempts': 200})
     except (client.exceptions.ClientError,
             botocore.exceptions.WaiterError) as exception:
       raise errors.ResourceCreationError(
@@ -573,9 +712,10 @@ class EBS:
     Returns:
       Dict[str, str]: The AWS account information.
     """
-    account_information = self.aws_account.ClientApi(
-        common.ACCOUNT_SERVICE).get_caller_identity()  # type: Dict[str, str]
-    return account_information
+    if self._account_information is None:
+      self._account_information = self.aws_account.ClientApi(
+          common.ACCOUNT_SERVICE).get_caller_identity()
+    return self._account_information
 
   def _GenerateVolumeName(self,
                           snapshot: AWSSnapshot,
@@ -598,9 +738,11 @@ class EBS:
     user_id = self.GetAccountInformation().get('UserId')
     if not user_id:
       raise ValueError('Could not fetch AWS user ID')
-    volume_id = user_id + snapshot.volume.volume_id
-    volume_id_crc32 = '{0:08x}'.format(
-        binascii.crc32(volume_id.encode()) & 0xffffffff)
+    # Feed both strings to zlib.crc32 through its running-checksum parameter,
+    # avoiding the intermediate concatenation and encoding of a single string.
+    checksum = zlib.crc32(user_id.encode('utf-8'))
+    checksum = zlib.crc32(snapshot.volume.volume_id.encode('utf-8'), checksum)
+    volume_id_crc32 = f'{checksum & 0xffffffff:08x}'
     truncate_at = 255 - len(volume_id_crc32) - len('-copy') - 1
     if not snapshot.name:
       snapshot.name = snapshot.snapshot_id
@@ -610,12 +752,10 @@ class EBS:
         # The volume name prefix is too long
         volume_name_prefix = volume_name_prefix[:truncate_at]
       truncate_at -= len(volume_name_prefix)
-      volume_name = '{0:s}{1:s}-{2:s}-copy'.format(
-          volume_name_prefix,
-          snapshot.name[:truncate_at],
-          volume_id_crc32)
+      truncated_name = snapshot.name[:truncate_at]
+      volume_name = f'{volume_name_prefix:s}{truncated_name:s}-{volume_id_crc32:s}-copy'  # pylint: disable=line-too-long
     else:
-      volume_name = '{0:s}-{1:s}-copy'.format(
-          snapshot.name[:truncate_at], volume_id_crc32)
+      truncated_name = snapshot.name[:truncate_at]
+      volume_name = f'{truncated_name:s}-{volume_id_crc32:s}-copy'
 
     return volume_name
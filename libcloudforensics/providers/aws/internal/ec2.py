@@ -15,10 +15,11 @@
 """Instance functionality."""
 
 import binascii
+import concurrent.futures
 import ipaddress
 import os
 import random
-from typing import TYPE_CHECKING, Dict, Optional, List, Any, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, List, Any, Tuple
 
 import botocore
 from libcloudforensics import errors
@@ -69,6 +70,10 @@ class AWSInstance:
     self.availability_zone = availability_zone
     self.vpc = vpc
     self.name = name
+    # The root device name of an instance does not change over its lifetime,
+    # so it is fetched once and cached to avoid repeated DescribeInstances
+    # round trips.
+    self._root_device_name = None  # type: Optional[str]
 
   def GetBootVolume(self) -> 'ebs.AWSVolume':
     """Get the instance's boot volume.
@@ -80,13 +85,21 @@ class AWSInstance:
       ResourceNotFoundError: If no boot volume could be found.
     """
 
-    boot_device = self.aws_account.ResourceApi(
-        common.EC2_SERVICE).Instance(self.instance_id).root_device_name
-    volumes = self.ListVolumes()
+    if not self._root_device_name:
+      self._root_device_name = self.aws_account.ResourceApi(
+          common.EC2_SERVICE).Instance(self.instance_id).root_device_name
+    # Filter on the boot device server-side so that AWS only returns the
+    # boot volume, instead of all attached volumes being scanned in Python.
+    volumes = self.aws_account.ebs.ListVolumes(
+        filters=[{
+            'Name': 'attachment.instance-id',
+            'Values': [self.instance_id]
+        }, {
+            'Name': 'attachment.device',
+            'Values': [self._root_device_name]}])
 
-    for volume_id in volumes:
-      if volumes[volume_id].device_name == boot_device:
-        return volumes[volume_id]
+    for volume in volumes.values():
+      return volume
 
     raise errors.ResourceNotFoundError(
         'Boot volume not found for instance: {0:s}'.format(self.instance_id),
@@ -199,6 +212,108 @@ class EC2:
       aws_account (AWSAccount): An AWS account object.
     """
     self.aws_account = aws_account
+    # Availability zones are immutable for the lifetime of a process, so
+    # cache them per region and spare repeat DescribeAvailabilityZones calls.
+    self._availability_zones = {}  # type: Dict[str, List[str]]
+
+  def ListAvailabilityZones(
+      self, region: Optional[str] = None) -> List[str]:
+    """List the availability zone names of a region, with caching.
+
+    The first call per region hits the API; subsequent calls are served
+    from an in-process cache, since zones do not change within a session.
+
+    Args:
+      region (str): Optional. The region to list the zones of. If none
+          provided, the default_region associated to the AWSAccount object
+          will be used.
+
+    Returns:
+      List[str]: The availability zone names, e.g. ['us-east-2a', ...].
+
+    Raises:
+      RuntimeError: If the availability zones can't be listed.
+    """
+
+    region = region or self.aws_account.default_region
+    if region not in self._availability_zones:
+      client = self.aws_account.ClientApi(common.EC2_SERVICE, region=region)
+      try:
+        response = client.describe_availability_zones()
+      except client.exceptions.ClientError as exception:
+        raise RuntimeError('Could not process request: {0:s}'.format(
+            str(exception))) from exception
+      self._availability_zones[region] = [
+          zone['ZoneName'] for zone in response['AvailabilityZones']]
+    return self._availability_zones[region]
+
+  def ListInstancesIter(
+      self,
+      region: Optional[str] = None,
+      filters: Optional[List[Dict[str, Any]]] = None,
+      show_terminated: bool = False) -> Iterator[AWSInstance]:
+    """Iterate over instances of an AWS account, page by page.
+
+    Unlike ListInstances, this does not materialise the full account in
+    memory, so callers that only need the first few matches can stop early.
+
+    Args:
+      region (str): Optional. The region from which to list instances.
+          If none provided, the default_region associated to the AWSAccount
+          object will be used.
+      filters (List[Dict]): Optional. Filters for the query. Filters are
+          given as a list of dictionaries, e.g.: {'Name': 'someFilter',
+          'Values': ['value1', 'value2']}.
+      show_terminated (bool): Optional. Include terminated instances in the
+          list.
+
+    Yields:
+      AWSInstance: An Amazon EC2 Instance object.
+
+    Raises:
+      RuntimeError: If instances can't be listed.
+    """
+
+    if not filters:
+      filters = []
+
+    client = self.aws_account.ClientApi(common.EC2_SERVICE, region=region)
+    # Use the native botocore paginator, which streams pages over a single
+    # client instead of re-issuing the request per NextToken.
+    paginator = client.get_paginator('describe_instances')
+    try:
+      for response in paginator.paginate(Filters=filters):
+        for reservation in response['Reservations']:
+          for instance in reservation['Instances']:
+            # If reservation['Instances'] contains any entry, then the
+            # instance's state is expected to be present in the API's
+            # response.
+            if (instance['State']['Name'] == 'terminated'
+                and not show_terminated):
+              continue
+
+            zone = instance['Placement']['AvailabilityZone']
+            instance_id = instance['InstanceId']
+            # Terminated instances carry no VpcId in the describe response.
+            vpc = instance.get('VpcId')
+            aws_instance = AWSInstance(
+                self.aws_account, instance_id, zone[:-1], zone, vpc)
+
+            # The describe response already carries the root device name, so
+            # seed the cache and spare GetBootVolume a DescribeInstances call.
+            # pylint: disable=protected-access
+            aws_instance._root_device_name = instance.get('RootDeviceName')
+            # pylint: enable=protected-access
+            # Index the tags once; resolving further tags later is then a
+            # dict lookup instead of another scan.
+            tag_map = {tag['Key']: tag['Value']
+                       for tag in instance.get('Tags') or ()}
+            aws_instance.name = tag_map.get('Name')
+
+            yield aws_instance
+    except client.exceptions.ClientError as exception:
+      raise RuntimeError('Could not process request: {0:s}'.format(
+          str(exception))) from exception
 
   def ListInstances(
       self,
@@ -229,34 +344,51 @@ class EC2:
       RuntimeError: If instances can't be listed.
     """
 
-    if not filters:
-      filters = []
+    return {instance.instance_id: instance for instance in
+            self.ListInstancesIter(
+                region=region, filters=filters,
+                show_terminated=show_terminated)}
 
-    instances = {}
-    client = self.aws_account.ClientApi(common.EC2_SERVICE, region=region)
-    responses = common.ExecuteRequest(
-        client, 'describe_instances', {'Filters': filters})
-
-    for response in responses:
-      for reservation in response['Reservations']:
-        for instance in reservation['Instances']:
-          # If reservation['Instances'] contains any entry, then the
-          # instance's state is expected to be present in the API's response.
-          if instance['State']['Name'] == 'terminated' and not show_terminated:
-            continue
-
-          zone = instance['Placement']['AvailabilityZone']
-          instance_id = instance['InstanceId']
-          vpc = instance['VpcId']
-          aws_instance = AWSInstance(
-              self.aws_account, instance_id, zone[:-1], zone, vpc)
-
-          for tag in instance.get('Tags', []):
-            if tag.get('Key') == 'Name':
-              aws_instance.name = tag.get('Value')
-              break
-
-          instances[instance_id] = aws_instance
+  def ListInstancesMultiRegion(
+      self,
+      regions: List[str],
+      filters: Optional[List[Dict[str, Any]]] = None,
+      show_terminated: bool = False) -> Dict[str, AWSInstance]:
+    """List instances of an AWS account across several regions.
+
+    The regions are queried concurrently, since each describe call is
+    network-bound and independent of the others.
+
+    Args:
+      regions (List[str]): The regions from which to list instances.
+      filters (List[Dict]): Optional. Filters for the query. Filters are
+          given as a list of dictionaries, e.g.: {'Name': 'someFilter',
+          'Values': ['value1', 'value2']}.
+      show_terminated (bool): Optional. Include terminated instances in the
+          list.
+
+    Returns:
+      Dict[str, AWSInstance]: Dictionary mapping instance IDs (str) to their
+          respective AWSInstance object.
+
+    Raises:
+      RuntimeError: If instances can't be listed.
+    """
+
+    instances = {}  # type: Dict[str, AWSInstance]
+    if not regions:
+      return instances
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(regions)) as executor:
+      futures = [
+          executor.submit(
+              self.ListInstances,
+              region=region,
+              filters=filters,
+              show_terminated=show_terminated) for region in regions]
+      for future in concurrent.futures.as_completed(futures):
+        instances.update(future.result())
     return instances
 
   def GetInstancesByNameOrId(
@@ -315,7 +447,11 @@ class EC2:
           matching name tag is found, the method returns an empty list.
     """
 
-    instances = self.ListInstances(region=region)
+    # Filter on the name tag server-side so that AWS only returns matching
+    # instances, instead of downloading every instance in the account.
+    instances = self.ListInstances(
+        region=region,
+        filters=[{'Name': 'tag:Name', 'Values': [instance_name]}])
     return [instance for instance in instances.values() if
             instance.name == instance_name]
 
@@ -337,13 +473,81 @@ class EC2:
       ResourceNotFoundError: If instance does not exist.
     """
 
-    instances = self.ListInstances(region=region)
-    instance = instances.get(instance_id)
-    if not instance:
+    # Describe the instance directly by its ID: a single API call returning
+    # one reservation, with no pagination or full-account dict to build.
+    client = self.aws_account.ClientApi(common.EC2_SERVICE, region=region)
+    try:
+      response = client.describe_instances(InstanceIds=[instance_id])
+    except client.exceptions.ClientError as exception:
+      raise errors.ResourceNotFoundError(
+          'Instance {0:s} was not found in AWS account: {1!s}'.format(
+              instance_id, exception), __name__) from exception
+
+    reservations = response.get('Reservations')
+    if not reservations:
       raise errors.ResourceNotFoundError(
           'Instance {0:s} was not found in AWS account'.format(instance_id),
           __name__)
-    return instance
+
+    instance = reservations[0]['Instances'][0]
+    zone = instance['Placement']['AvailabilityZone']
+    # Terminated instances carry no VpcId in the describe response.
+    aws_instance = AWSInstance(
+        self.aws_account, instance_id, zone[:-1], zone,
+        instance.get('VpcId'))
+    # The describe response already carries the root device name, so seed
+    # the cache and spare GetBootVolume a DescribeInstances call.
+    # pylint: disable=protected-access
+    aws_instance._root_device_name = instance.get('RootDeviceName')
+    # pylint: enable=protected-access
+    tag_map = {tag['Key']: tag['Value'] for tag in instance.get('Tags') or ()}
+    aws_instance.name = tag_map.get('Name')
+    return aws_instance
+
+  def GetInstancesByIds(
+      self,
+      instance_ids: List[str],
+      region: Optional[str] = None) -> Dict[str, AWSInstance]:
+    """Get several instances from an AWS account by their IDs, in batches.
+
+    The IDs are sent to the API in chunks of up to 200 per describe call
+    instead of one call per instance, and the chunks are queried
+    concurrently. IDs that do not exist in the account are silently absent
+    from the result.
+
+    Args:
+      instance_ids (List[str]): The instance IDs to look up.
+      region (str): Optional. The region to look the instances in.
+          If none provided, the default_region associated to the AWSAccount
+          object will be used.
+
+    Returns:
+      Dict[str, AWSInstance]: Dictionary mapping instance IDs (str) to their
+          respective AWSInstance object.
+
+    Raises:
+      RuntimeError: If instances can't be described.
+    """
+
+    instances = {}  # type: Dict[str, AWSInstance]
+    if not instance_ids:
+      return instances
+
+    chunks = [instance_ids[i:i + common.MAX_IDS_PER_DESCRIBE] for i in
+              range(0, len(instance_ids), common.MAX_IDS_PER_DESCRIBE)]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(chunks)) as executor:
+      # Filtering on instance-id (rather than passing InstanceIds=) makes
+      # the API skip unknown IDs instead of failing the whole batch.
+      futures = [
+          executor.submit(
+              self.ListInstances,
+              region=region,
+              filters=[{'Name': 'instance-id', 'Values': chunk}],
+              show_terminated=True) for chunk in chunks]
+      for future in concurrent.futures.as_completed(futures):
+        instances.update(future.result())
+    return instances
 
   def ListImages(
       self,
@@ -14,9 +14,12 @@
 # limitations under the License.
 """Bucket functionality."""
 
+import concurrent.futures
 import os
 from typing import TYPE_CHECKING, List, Dict, Optional, Any
 
+import boto3.s3.transfer
+
 from libcloudforensics import errors
 from libcloudforensics import logging_utils
 from libcloudforensics.providers.aws.internal import common
@@ -27,6 +30,15 @@ from libcloudforensics.providers.utils.storage_utils import SplitStoragePath
 logging_utils.SetUpLogger(__name__)
 logger = logging_utils.GetLogger(__name__)
 
+# Multipart upload tuning. The boto3 defaults (8 MiB parts, 10 threads) cap
+# throughput on GB-scale disk images over high-latency links; larger parts
+# and more concurrency keep the pipe full, and the bigger read chunk size
+# reduces per-write Python overhead.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNK_SIZE = 64 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 16
+MULTIPART_IO_CHUNK_SIZE = 1024 * 1024
+
 if TYPE_CHECKING:
   # TYPE_CHECKING is always False at runtime, therefore it is safe to ignore
   # the following cyclic import, as it it only used for type hints
@@ -52,6 +64,21 @@ class S3:
 
     self.aws_account = aws_account
 
+  def _Client(self) -> Any:
+    """Get the S3 client for the account.
+
+    The client is cached per (service, region) by AWSAccount.ClientApi, so
+    every S3 operation reuses one client and its warm connection pool
+    instead of redoing credential resolution and endpoint discovery. The
+    cache is kept on the account rather than this object so it follows the
+    account's session.
+
+    Returns:
+      botocore.client.S3: An S3 client object.
+    """
+
+    return self.aws_account.ClientApi(common.S3_SERVICE)
+
   def CreateBucket(
       self,
       name: str,
@@ -83,9 +110,9 @@ class S3:
       ResourceCreationError: If the bucket couldn't be created or already exists.  # pylint: disable=line-too-long
     """
 
-    client = self.aws_account.ClientApi(common.S3_SERVICE)
+    client = self._Client()
+    desired_region = region or self.aws_account.default_region
     try:
-      desired_region = region or self.aws_account.default_region
       if desired_region == 'us-east-1':
         bucket = client.create_bucket(
             Bucket=name,
@@ -138,10 +165,13 @@ class S3:
       self,
       s3_path: str,
       filepath: str,
-      extra_args: Optional[Dict[str, str]] = None) -> None:
+      extra_args: Optional[Dict[str, str]] = None,
+      chunk_size: int = MULTIPART_CHUNK_SIZE,
+      max_concurrency: int = MULTIPART_MAX_CONCURRENCY) -> None:
     """Upload a local file to an S3 bucket.
 
-    Keeps the local filename intact.
+    Keeps the local filename intact. Large files are sent as concurrent
+    multipart uploads, tuned for disk-image-sized objects.
 
     Args:
       s3_path (str): Path to the target S3 bucket.
@@ -152,21 +182,32 @@ class S3:
         that will be directly supplied to the upload_file call.  Useful for
         specifying encryption parameters.
           Ex: {'ServerSideEncryption': "AES256"}
+      chunk_size (int): Optional. The multipart part size, in bytes. Defaults
+        to 64 MiB.
+      max_concurrency (int): Optional. The number of threads uploading parts
+        concurrently. Defaults to 16.
     Raises:
       ResourceCreationError: If the object couldn't be uploaded.
     """
-    client = self.aws_account.ClientApi(common.S3_SERVICE)
+    client = self._Client()
     if not s3_path.startswith('s3://'):
       s3_path = 's3://' + s3_path
     if not s3_path.endswith('/'):
       s3_path = s3_path + '/'
+    transfer_config = boto3.s3.transfer.TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=chunk_size,
+        max_concurrency=max_concurrency,
+        use_threads=True,
+        io_chunksize=MULTIPART_IO_CHUNK_SIZE)
     try:
       (bucket, path) = SplitStoragePath(s3_path)
       client.upload_file(
           filepath,
           bucket,
           '{0:s}{1:s}'.format(path, os.path.basename(filepath)),
-          ExtraArgs=extra_args)
+          ExtraArgs=extra_args,
+          Config=transfer_config)
     except FileNotFoundError as exception:
       raise errors.ResourceNotFoundError(
           'Could not upload file {0:s}: {1:s}'.format(
@@ -178,6 +219,68 @@ class S3:
               filepath, str(exception)),
           __name__) from exception
 
+  def PutBatch(
+      self,
+      s3_path: str,
+      local_files: List[str],
+      extra_args: Optional[Dict[str, str]] = None,
+      concurrency: int = 32) -> None:
+    """Upload several local files to an S3 bucket concurrently.
+
+    For directories of small files, uploading sequentially collapses to the
+    per-request overhead (TCP, TLS, signing); submitting the uploads to a
+    thread pool over one shared client amortizes that cost. Keeps the local
+    filenames intact.
+
+    Args:
+      s3_path (str): Path to the target S3 bucket.
+          Ex: s3://test/bucket
+      local_files (List[str]): Paths of the files to be uploaded.
+      extra_args (Dict[str, str]): Optional. A dictionary of extra arguments
+        that will be directly supplied to the upload_file calls. Useful for
+        specifying encryption parameters.
+          Ex: {'ServerSideEncryption': "AES256"}
+      concurrency (int): Optional. The number of concurrent uploads.
+        Defaults to 32.
+
+    Raises:
+      ResourceCreationError: If any of the objects couldn't be uploaded. The
+          error message aggregates the failures per file.
+    """
+    if not local_files:
+      return
+
+    # One client serves all worker threads: boto3 clients are thread-safe,
+    # and sharing the connection pool avoids per-upload handshakes.
+    client = self._Client()
+    if not s3_path.startswith('s3://'):
+      s3_path = 's3://' + s3_path
+    if not s3_path.endswith('/'):
+      s3_path = s3_path + '/'
+    (bucket, path) = SplitStoragePath(s3_path)
+
+    failures = []
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency) as executor:
+      futures = {
+          executor.submit(
+              client.upload_file,
+              filepath,
+              bucket,
+              '{0:s}{1:s}'.format(path, os.path.basename(filepath)),
+              ExtraArgs=extra_args): filepath for filepath in local_files}
+      for future in concurrent.futures.as_completed(futures):
+        try:
+          future.result()
+        except (FileNotFoundError, client.exceptions.ClientError) as exception:
+          failures.append('{0:s}: {1:s}'.format(
+              futures[future], str(exception)))
+
+    if failures:
+      raise errors.ResourceCreationError(
+          'Could not upload files: {0:s}'.format('; '.join(sorted(failures))),
+          __name__)
+
   def GCSToS3(self,
               project_id: str,
               gcs_path: str,
@@ -240,10 +343,9 @@ class S3:
     Returns:
       bool: True if the object exists and you have permissions to GetObject.
         False otherwise."""
-    s3_client = self.aws_account.ClientApi(common.S3_SERVICE)
+    s3_client = self._Client()
 
-    if key.startswith('/'):
-      key = key.lstrip('/')
+    key = key.lstrip('/')
 
     try:
       s3_client.head_object(Bucket=bucket, Key=key)
@@ -277,10 +379,9 @@ class S3:
       bucket (str): The S3 bucket.
       key (str): The object key (path).
     """
-    if key.startswith('/'):
-      key = key.lstrip('/')
+    key = key.lstrip('/')
 
-    s3_client = self.aws_account.ClientApi(common.S3_SERVICE)
+    s3_client = self._Client()
     s3_client.delete_object(Bucket=bucket, Key=key)
 
   def RmBucket(
@@ -293,5 +394,5 @@ class S3:
       bucket (str): The bucket name.
     """
     logger.info('Deleting bucket {0:s}'.format(bucket))
-    s3_client = self.aws_account.ClientApi(common.S3_SERVICE)
+    s3_client = self._Client()
     s3_client.delete_bucket(Bucket=bucket)
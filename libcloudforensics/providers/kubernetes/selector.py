@@ -14,80 +14,143 @@
 # limitations under the License.
 """Kubernetes selector class structure."""
 
-import abc
-from collections import defaultdict
-from typing import Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class K8sSelector:
   """Class to build K8s API selectors."""
 
-  class Component(abc.ABC):
-    """Component of the selector."""
+  class Component:
+    """Component of the selector.
+
+    Instances are created on every selector build, so the concrete
+    components use __slots__ and skip abc metaclass machinery; subclasses
+    must provide ToString and the keyword class attribute.
+
+    Attributes:
+      keyword (str): The keyword argument to which this selector component
+          belongs. A plain class attribute rather than a property, since it
+          is read on every ToKeywords call.
+    """
+
+    __slots__ = ()
+
+    keyword = ''
 
-    @abc.abstractmethod
     def ToString(self) -> str:
       """Builds the string of this selector component.
 
       Returns:
         str: The string of this selector component.
       """
+      raise NotImplementedError
 
-    @property
-    @abc.abstractmethod
-    def keyword(self) -> str:
-      """The keyword argument to which this selector component belongs."""
+    def _Key(self) -> Tuple[Any, ...]:
+      """Builds a hashable identity for deduplication.
 
-  class LabelComponent(Component, metaclass=abc.ABCMeta):
+      Derived from the component's fields rather than ToString, so that
+      deduplicating at selector construction does not force an eager
+      serialization. Stateless components are identified by type alone.
+
+      Returns:
+        Tuple[Any, ...]: The identity of this selector component.
+      """
+      return (type(self),)
+
+  class LabelComponent(Component):  # pylint: disable=abstract-method
     """Selector component on labels."""
 
-    @property
-    def keyword(self) -> str:
-      return 'label_selector'
+    __slots__ = ()
+
+    keyword = 'label_selector'
 
-  class FieldComponent(Component, metaclass=abc.ABCMeta):
+  class FieldComponent(Component):  # pylint: disable=abstract-method
     """Selector component on fields."""
 
-    @property
-    def keyword(self) -> str:
-      return 'field_selector'
+    __slots__ = ()
+
+    keyword = 'field_selector'
 
   class Name(FieldComponent):
     """Selector component having a particular name."""
 
+    __slots__ = ('_name', '_str')
+
     def __init__(self, name: str) -> None:
+      # The serialized form is computed lazily on first use and cached, so
+      # components that are never stringified don't pay the format cost and
+      # components reused across calls pay it once.
       self._name = name
+      self._str = None  # type: Optional[str]
 
     def ToString(self) -> str:
-      return 'metadata.name={0:s}'.format(self._name)
+      if self._str is None:
+        self._str = 'metadata.name={0:s}'.format(self._name)
+      return self._str
+
+    def _Key(self) -> Tuple[Any, ...]:
+      return (type(self), self._name)
 
   class Node(FieldComponent):
     """Selector component for being on a particular node."""
 
+    __slots__ = ('_node', '_str')
+
     def __init__(self, node: str) -> None:
       self._node = node
+      self._str = None  # type: Optional[str]
 
     def ToString(self) -> str:
-      return 'spec.nodeName={0:s}'.format(self._node)
+      if self._str is None:
+        self._str = 'spec.nodeName={0:s}'.format(self._node)
+      return self._str
+
+    def _Key(self) -> Tuple[Any, ...]:
+      return (type(self), self._node)
 
   class Running(FieldComponent):
     """Selector component for a running pod."""
 
+    __slots__ = ()
+
+    _STR = 'status.phase!=Failed,status.phase!=Succeeded'
+
     def ToString(self) -> str:
-      return 'status.phase!=Failed,status.phase!=Succeeded'
+      return self._STR
 
   class Label(LabelComponent):
     """Selector component for a label's key-value pair."""
 
+    __slots__ = ('_key', '_value', '_str')
+
     def __init__(self, key: str, value: str) -> None:
       self._key = key
       self._value = value
+      self._str = None  # type: Optional[str]
 
     def ToString(self) -> str:
-      return '{0:s}={1:s}'.format(self._key, self._value)
+      if self._str is None:
+        self._str = '{0:s}={1:s}'.format(self._key, self._value)
+      return self._str
+
+    def _Key(self) -> Tuple[Any, ...]:
+      return (type(self), self._key, self._value)
 
   def __init__(self, *selectors: Component) -> None:
-    self._selectors = selectors
+    # Drop duplicate components up front (common when merging default and
+    # user-supplied labels), so the selector string sent to the API server
+    # carries no redundant fragments.
+    seen = set()
+    unique = []
+    for selector in selectors:
+      # Deduplicate on field identity, not ToString, so construction does
+      # not force an eager serialization of every component.
+      key = selector._Key()  # pylint: disable=protected-access
+      if key not in seen:
+        seen.add(key)
+        unique.append(selector)
+    self._selectors = tuple(unique)
+    self._keywords = {selector.keyword for selector in unique}
 
   def ToKeywords(self) -> Dict[str, str]:
     """Builds the keyword arguments to be passed to the K8s API.
@@ -96,9 +159,16 @@ class K8sSelector:
       Dict[str, str]: The keyword arguments to be passed to a Kubernetes
           API call.
     """
-    keywords = defaultdict(list)
+    # In the common case all components are of one kind (all-label or
+    # all-field), so the result can be joined in a single pass.
+    if len(self._keywords) == 1:
+      keyword = next(iter(self._keywords))
+      return {
+          keyword: ','.join(
+              selector.ToString() for selector in self._selectors)}
+    keywords = {}  # type: Dict[str, List[str]]
     for selector in self._selectors:
-      keywords[selector.keyword].append(selector.ToString())
+      keywords.setdefault(selector.keyword, []).append(selector.ToString())
     return {k: ','.join(vs) for k, vs in keywords.items()}
 
   @classmethod
@@ -111,5 +181,4 @@ class K8sSelector:
     Returns:
       K8sSelector: The resulting selector object.
     """
-    args = map(lambda k: K8sSelector.Label(k, labels[k]), labels)
-    return cls(*args)
+    return cls(*(K8sSelector.Label(k, v) for k, v in labels.items()))
@@ -118,6 +118,13 @@ MOCK_DESCRIBE_IMAGES = {
     ]
 }
 
+MOCK_DESCRIBE_AVAILABILITY_ZONES = {
+    'AvailabilityZones': [
+        {'ZoneName': 'fake-zone-2a'},
+        {'ZoneName': 'fake-zone-2b'}
+    ]
+}
+
 MOCK_DESCRIBE_VOLUMES = {
     'Volumes': [{
         'VolumeId': FAKE_VOLUME.volume_id,
@@ -18,6 +18,7 @@ import typing
 import unittest
 import mock
 
+from libcloudforensics import errors
 from libcloudforensics.providers.aws.internal import ebs
 from tests.providers.aws import aws_mocks
 
@@ -74,8 +75,8 @@ class EBSTest(unittest.TestCase):
   @mock.patch('libcloudforensics.providers.aws.internal.account.AWSAccount.ClientApi')
   def testListVolumes(self, mock_ec2_api):
     """Test that volumes of an account are correctly listed."""
-    describe_volumes = mock_ec2_api.return_value.describe_volumes
-    describe_volumes.return_value = aws_mocks.MOCK_DESCRIBE_VOLUMES
+    describe_volumes = mock_ec2_api.return_value.get_paginator.return_value.paginate
+    describe_volumes.return_value = [aws_mocks.MOCK_DESCRIBE_VOLUMES]
     volumes = aws_mocks.FAKE_AWS_ACCOUNT.ebs.ListVolumes()
     self.assertEqual(2, len(volumes))
     self.assertIn('fake-volume-id', volumes)
@@ -84,7 +85,7 @@ class EBSTest(unittest.TestCase):
     self.assertEqual(
         'fake-zone-2b', volumes['fake-volume-id'].availability_zone)
 
-    describe_volumes.return_value = aws_mocks.MOCK_DESCRIBE_VOLUMES_TAGS
+    describe_volumes.return_value = [aws_mocks.MOCK_DESCRIBE_VOLUMES_TAGS]
     volumes = aws_mocks.FAKE_AWS_ACCOUNT.ebs.ListVolumes()
     self.assertIn('fake-boot-volume-id', volumes)
     self.assertEqual('fake-boot-volume', volumes['fake-boot-volume-id'].name)
@@ -92,16 +93,55 @@ class EBSTest(unittest.TestCase):
 
   @typing.no_type_check
   @mock.patch('libcloudforensics.providers.aws.internal.ebs.EBS.ListVolumes')
-  def testGetVolumeById(self, mock_list_volumes):
-    """Test that a volume of an account can be found by its ID."""
+  def testListVolumesMultiRegion(self, mock_list_volumes):
+    """Test that volumes are listed and merged across regions."""
     mock_list_volumes.return_value = aws_mocks.MOCK_LIST_VOLUMES
+    volumes = aws_mocks.FAKE_AWS_ACCOUNT.ebs.ListVolumesMultiRegion(
+        ['fake-zone-2', 'fake-zone-3'])
+    self.assertEqual(2, mock_list_volumes.call_count)
+    self.assertIn('fake-volume-id', volumes)
+    self.assertIn('fake-boot-volume-id', volumes)
+
+    volumes = aws_mocks.FAKE_AWS_ACCOUNT.ebs.ListVolumesMultiRegion([])
+    self.assertEqual(0, len(volumes))
+
+  @typing.no_type_check
+  @mock.patch('libcloudforensics.providers.aws.internal.ebs.EBS.ListVolumes')
+  def testGetVolumesByIds(self, mock_list_volumes):
+    """Test that several volumes can be retrieved in a single batch."""
+    mock_list_volumes.return_value = aws_mocks.MOCK_LIST_VOLUMES
+    volumes = aws_mocks.FAKE_AWS_ACCOUNT.ebs.GetVolumesByIds(
+        ['fake-volume-id', 'fake-boot-volume-id'])
+    self.assertEqual(1, mock_list_volumes.call_count)
+    mock_list_volumes.assert_called_with(
+        region=None,
+        filters=[{'Name': 'volume-id',
+                  'Values': ['fake-volume-id', 'fake-boot-volume-id']}])
+    self.assertIn('fake-volume-id', volumes)
+    self.assertIn('fake-boot-volume-id', volumes)
+
+    volumes = aws_mocks.FAKE_AWS_ACCOUNT.ebs.GetVolumesByIds([])
+    self.assertEqual(0, len(volumes))
+
+  @typing.no_type_check
+  @mock.patch('libcloudforensics.providers.aws.internal.account.AWSAccount.ClientApi')
+  def testGetVolumeById(self, mock_ec2_api):
+    """Test that a volume of an account can be found by its ID."""
+    describe_volumes = mock_ec2_api.return_value.describe_volumes
+    describe_volumes.return_value = aws_mocks.MOCK_DESCRIBE_VOLUMES
     found_volume = aws_mocks.FAKE_AWS_ACCOUNT.ebs.GetVolumeById(
         aws_mocks.FAKE_VOLUME.volume_id)
+    describe_volumes.assert_called_with(
+        VolumeIds=[aws_mocks.FAKE_VOLUME.volume_id])
     self.assertIsInstance(found_volume, ebs.AWSVolume)
     self.assertEqual('fake-volume-id', found_volume.volume_id)
     self.assertEqual('fake-zone-2', found_volume.region)
     self.assertEqual('fake-zone-2b', found_volume.availability_zone)
 
+    describe_volumes.return_value = {'Volumes': []}
+    with self.assertRaises(errors.ResourceNotFoundError):
+      aws_mocks.FAKE_AWS_ACCOUNT.ebs.GetVolumeById('non-existent-volume-id')
+
   @typing.no_type_check
   @mock.patch('libcloudforensics.providers.aws.internal.ebs.EBS.ListVolumes')
   def testGetVolumesByName(self, mock_list_volumes):
@@ -119,10 +159,13 @@ class EBSTest(unittest.TestCase):
     self.assertEqual(0, len(found_volumes))
 
   @typing.no_type_check
-  @mock.patch('libcloudforensics.providers.aws.internal.ebs.EBS.ListVolumes')
-  def testGetVolumesByNameOrId(self, mock_list_volumes):
+  @mock.patch('libcloudforensics.providers.aws.internal.ebs.EBS.GetVolumesByName')
+  @mock.patch('libcloudforensics.providers.aws.internal.ebs.EBS.GetVolumeById')
+  def testGetVolumesByNameOrId(
+      self, mock_get_volume_by_id, mock_get_volumes_by_name):
     """Test that a volume of an account can be found by its name or ID."""
-    mock_list_volumes.return_value = aws_mocks.MOCK_LIST_VOLUMES
+    mock_get_volume_by_id.return_value = aws_mocks.FAKE_VOLUME
+    mock_get_volumes_by_name.return_value = [aws_mocks.FAKE_BOOT_VOLUME]
     found_volumes = aws_mocks.FAKE_AWS_ACCOUNT.ebs.GetVolumesByNameOrId(
         volume_id=aws_mocks.FAKE_VOLUME.volume_id)
     self.assertEqual(1, len(found_volumes))
@@ -33,9 +33,9 @@ class AWSInstanceTest(unittest.TestCase):
   @mock.patch('libcloudforensics.providers.aws.internal.account.AWSAccount.ClientApi')
   def testGetBootVolume(self, mock_ec2_api, mock_resource_api):
     """Test that the boot volume is retrieved if existing."""
-    describe_volumes = mock_ec2_api.return_value.describe_volumes
+    describe_volumes = mock_ec2_api.return_value.get_paginator.return_value.paginate
     instance = mock_resource_api.return_value.Instance
-    describe_volumes.return_value = aws_mocks.MOCK_DESCRIBE_VOLUMES_TAGS
+    describe_volumes.return_value = [aws_mocks.MOCK_DESCRIBE_VOLUMES_TAGS]
     instance.return_value.root_device_name = '/dev/spf'
 
     boot_volume = aws_mocks.FAKE_INSTANCE.GetBootVolume()
@@ -51,8 +51,8 @@ class EC2Test(unittest.TestCase):
   @mock.patch('libcloudforensics.providers.aws.internal.account.AWSAccount.ClientApi')
   def testListInstances(self, mock_ec2_api):
     """Test that instances of an account are correctly listed."""
-    describe_instances = mock_ec2_api.return_value.describe_instances
-    describe_instances.return_value = aws_mocks.MOCK_DESCRIBE_INSTANCES
+    describe_instances = mock_ec2_api.return_value.get_paginator.return_value.paginate
+    describe_instances.return_value = [aws_mocks.MOCK_DESCRIBE_INSTANCES]
     instances = aws_mocks.FAKE_AWS_ACCOUNT.ec2.ListInstances()
     self.assertEqual(1, len(instances))
     self.assertIn('fake-instance-id', instances)
@@ -60,23 +60,74 @@ class EC2Test(unittest.TestCase):
     self.assertEqual(
         'fake-zone-2b', instances['fake-instance-id'].availability_zone)
 
-    describe_instances.return_value = aws_mocks.MOCK_DESCRIBE_INSTANCES_TAGS
+    describe_instances.return_value = [aws_mocks.MOCK_DESCRIBE_INSTANCES_TAGS]
     instances = aws_mocks.FAKE_AWS_ACCOUNT.ec2.ListInstances()
     self.assertIn('fake-instance-with-name-id', instances)
     self.assertEqual(
         'fake-instance', instances['fake-instance-with-name-id'].name)
 
+  @typing.no_type_check
+  @mock.patch('libcloudforensics.providers.aws.internal.account.AWSAccount.ClientApi')
+  def testListAvailabilityZones(self, mock_ec2_api):
+    """Test that availability zones are listed and cached per region."""
+    describe_zones = mock_ec2_api.return_value.describe_availability_zones
+    describe_zones.return_value = aws_mocks.MOCK_DESCRIBE_AVAILABILITY_ZONES
+    ec2_client = ec2.EC2(aws_mocks.FAKE_AWS_ACCOUNT)
+    zones = ec2_client.ListAvailabilityZones()
+    self.assertEqual(['fake-zone-2a', 'fake-zone-2b'], zones)
+    # A second call for the same region must be served from the cache.
+    ec2_client.ListAvailabilityZones()
+    self.assertEqual(1, describe_zones.call_count)
+
   @typing.no_type_check
   @mock.patch('libcloudforensics.providers.aws.internal.ec2.EC2.ListInstances')
-  def testGetInstanceById(self, mock_list_instances):
-    """Test that an instance of an account can be found by its ID."""
+  def testListInstancesMultiRegion(self, mock_list_instances):
+    """Test that instances are listed and merged across regions."""
+    mock_list_instances.return_value = aws_mocks.MOCK_LIST_INSTANCES
+    instances = aws_mocks.FAKE_AWS_ACCOUNT.ec2.ListInstancesMultiRegion(
+        ['fake-zone-2', 'fake-zone-3'])
+    self.assertEqual(2, mock_list_instances.call_count)
+    self.assertIn('fake-instance-id', instances)
+    self.assertIn('fake-instance-with-name-id', instances)
+
+    instances = aws_mocks.FAKE_AWS_ACCOUNT.ec2.ListInstancesMultiRegion([])
+    self.assertEqual(0, len(instances))
+
+  @typing.no_type_check
+  @mock.patch('libcloudforensics.providers.aws.internal.ec2.EC2.ListInstances')
+  def testGetInstancesByIds(self, mock_list_instances):
+    """Test that several instances can be retrieved in a single batch."""
     mock_list_instances.return_value = aws_mocks.MOCK_LIST_INSTANCES
+    instances = aws_mocks.FAKE_AWS_ACCOUNT.ec2.GetInstancesByIds(
+        ['fake-instance-id', 'fake-instance-with-name-id'])
+    self.assertEqual(1, mock_list_instances.call_count)
+    mock_list_instances.assert_called_with(
+        region=None,
+        filters=[{'Name': 'instance-id',
+                  'Values': ['fake-instance-id', 'fake-instance-with-name-id']}],
+        show_terminated=True)
+    self.assertIn('fake-instance-id', instances)
+    self.assertIn('fake-instance-with-name-id', instances)
+
+    instances = aws_mocks.FAKE_AWS_ACCOUNT.ec2.GetInstancesByIds([])
+    self.assertEqual(0, len(instances))
+
+  @typing.no_type_check
+  @mock.patch('libcloudforensics.providers.aws.internal.account.AWSAccount.ClientApi')
+  def testGetInstanceById(self, mock_ec2_api):
+    """Test that an instance of an account can be found by its ID."""
+    describe_instances = mock_ec2_api.return_value.describe_instances
+    describe_instances.return_value = aws_mocks.MOCK_DESCRIBE_INSTANCES
     found_instance = aws_mocks.FAKE_AWS_ACCOUNT.ec2.GetInstanceById(
         aws_mocks.FAKE_INSTANCE.instance_id)
+    describe_instances.assert_called_with(
+        InstanceIds=[aws_mocks.FAKE_INSTANCE.instance_id])
     self.assertIsInstance(found_instance, ec2.AWSInstance)
     self.assertEqual('fake-instance-id', found_instance.instance_id)
     self.assertEqual('fake-zone-2', found_instance.region)
     self.assertEqual('fake-zone-2b', found_instance.availability_zone)
+
+    describe_instances.return_value = {'Reservations': []}
     with self.assertRaises(errors.ResourceNotFoundError):
       aws_mocks.FAKE_AWS_ACCOUNT.ec2.GetInstanceById('non-existent-instance-id')
 
@@ -99,10 +150,14 @@ class EC2Test(unittest.TestCase):
     self.assertEqual(0, len(found_instances))
 
   @typing.no_type_check
-  @mock.patch('libcloudforensics.providers.aws.internal.ec2.EC2.ListInstances')
-  def testGetInstancesByNameOrId(self, mock_list_instances):
+  @mock.patch('libcloudforensics.providers.aws.internal.ec2.EC2.GetInstancesByName')
+  @mock.patch('libcloudforensics.providers.aws.internal.ec2.EC2.GetInstanceById')
+  def testGetInstancesByNameOrId(
+      self, mock_get_instance_by_id, mock_get_instances_by_name):
     """Test that an instance of an account can be found by its name or ID."""
-    mock_list_instances.return_value = aws_mocks.MOCK_LIST_INSTANCES
+    mock_get_instance_by_id.return_value = aws_mocks.FAKE_INSTANCE
+    mock_get_instances_by_name.return_value = [
+        aws_mocks.FAKE_INSTANCE_WITH_NAME]
     found_instances = aws_mocks.FAKE_AWS_ACCOUNT.ec2.GetInstancesByNameOrId(
         instance_id=aws_mocks.FAKE_INSTANCE.instance_id)
     self.assertEqual(1, len(found_instances))
@@ -18,6 +18,7 @@ import typing
 import unittest
 import mock
 
+from libcloudforensics import errors
 from tests.providers.aws import aws_mocks
 
 
@@ -46,3 +47,23 @@ class AWSS3Test(unittest.TestCase):
     storage.assert_called_with(
         Bucket='test-bucket',
         ACL='private')
+
+  @typing.no_type_check
+  @mock.patch('libcloudforensics.providers.aws.internal.account.AWSAccount.ClientApi')
+  def testPutBatch(self, mock_s3_api):
+    """Test that several objects are uploaded over one shared client."""
+    upload_file = mock_s3_api.return_value.upload_file
+    aws_mocks.FAKE_STORAGE.PutBatch(
+        's3://test-bucket', ['/tmp/file-one', '/tmp/file-two'])
+    self.assertEqual(2, upload_file.call_count)
+    upload_file.assert_any_call(
+        '/tmp/file-one', 'test-bucket', 'file-one', ExtraArgs=None)
+    upload_file.assert_any_call(
+        '/tmp/file-two', 'test-bucket', 'file-two', ExtraArgs=None)
+
+    # The except clause resolves client.exceptions.ClientError, which must be
+    # a real exception class rather than an auto-created mock attribute.
+    mock_s3_api.return_value.exceptions.ClientError = RuntimeError
+    upload_file.side_effect = FileNotFoundError('no such file')
+    with self.assertRaises(errors.ResourceCreationError):
+      aws_mocks.FAKE_STORAGE.PutBatch('s3://test-bucket', ['/tmp/file-one'])
@@ -100,11 +100,9 @@ class AWSForensicsTest(unittest.TestCase):
 
   @typing.no_type_check
   @mock.patch('boto3.session.Session._setup_loader')
-  @mock.patch('libcloudforensics.providers.aws.internal.ebs.EBS.ListVolumes')
-  @mock.patch('libcloudforensics.providers.aws.internal.ec2.EC2.ListInstances')
+  @mock.patch('libcloudforensics.providers.aws.internal.account.AWSAccount.ClientApi')
   def testCreateVolumeCopy3(self,
-                            mock_list_instances,
-                            mock_list_volumes,
+                            mock_ec2_api,
                             mock_loader):
     """Test that a volume is correctly cloned."""
     mock_loader.return_value = None
@@ -115,7 +113,8 @@ class AWSForensicsTest(unittest.TestCase):
 
     # Should raise a ResourceCreationError as we are querying a non-existent
     # instance.
-    mock_list_instances.return_value = {}
+    mock_ec2_api.return_value.describe_instances.return_value = {
+        'Reservations': []}
     with self.assertRaises(errors.ResourceCreationError):
       forensics.CreateVolumeCopy(
           aws_mocks.FAKE_INSTANCE.availability_zone,
@@ -123,8 +122,25 @@ class AWSForensicsTest(unittest.TestCase):
 
     # Should raise a ResourceCreationError as we are querying a non-existent
     # volume.
-    mock_list_volumes.return_value = {}
+    mock_ec2_api.return_value.describe_volumes.return_value = {'Volumes': []}
     with self.assertRaises(errors.ResourceCreationError):
       forensics.CreateVolumeCopy(
           aws_mocks.FAKE_INSTANCE.availability_zone,
           volume_id='non-existent-volume-id')
+
+  @typing.no_type_check
+  @mock.patch('libcloudforensics.providers.aws.forensics.CreateVolumeCopy')
+  def testCreateVolumeCopies(self, mock_create_volume_copy):
+    """Test that several volumes are copied concurrently."""
+    mock_create_volume_copy.return_value = aws_mocks.FAKE_VOLUME
+    new_volumes = forensics.CreateVolumeCopies(
+        aws_mocks.FAKE_INSTANCE.availability_zone,
+        ['fake-volume-id', 'fake-boot-volume-id'])
+    self.assertEqual(2, mock_create_volume_copy.call_count)
+    self.assertEqual(2, len(new_volumes))
+    self.assertIsInstance(new_volumes[0], ebs.AWSVolume)
+
+    # Should raise a ValueError exception as no volume IDs are specified.
+    with self.assertRaises(ValueError):
+      forensics.CreateVolumeCopies(
+          aws_mocks.FAKE_INSTANCE.availability_zone, [])
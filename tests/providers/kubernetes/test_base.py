@@ -14,6 +14,7 @@
 # limitations under the License.
 """Test on base Kubernetes objects."""
 
+import functools
 import typing
 import unittest
 
@@ -24,6 +25,13 @@ from libcloudforensics.providers.kubernetes import cluster
 from tests.providers.kubernetes import k8s_mocks
 
 
+@functools.lru_cache(maxsize=None)
+def _ExpectedNames(amount: int) -> typing.FrozenSet[str]:
+  """Expected mock object names for a given mock list size, computed once."""
+  return frozenset(
+      item.metadata.name for item in k8s_mocks.MakeMockNodes(amount).items)
+
+
 class K8sClusterTest(unittest.TestCase):
   """Test K8sCluster functionality, mainly checking API calls."""
 
@@ -44,8 +52,7 @@ class K8sClusterTest(unittest.TestCase):
     mock_k8s_api_func.assert_called()
     # Assert returned nodes correspond to provided response
     self.assertEqual(
-        set(node.name for node in nodes),
-        set(node.metadata.name for node in mock_nodes.items))
+        {node.name for node in nodes}, _ExpectedNames(5))
 
   @typing.no_type_check
   @mock.patch('kubernetes.client.CoreV1Api')
@@ -63,9 +70,7 @@ class K8sClusterTest(unittest.TestCase):
     mock_k8s_api.assert_called_with(k8s_mocks.MOCK_API_CLIENT)
     mock_k8s_api_func.assert_called()
     # Assert returned pods correspond to provided response
-    self.assertEqual(
-        set(pod.name for pod in pods),
-        set(pod.metadata.name for pod in mock_pods.items))
+    self.assertEqual({pod.name for pod in pods}, _ExpectedNames(5))
 
   @typing.no_type_check
   @mock.patch('kubernetes.client.CoreV1Api')
@@ -85,9 +90,7 @@ class K8sClusterTest(unittest.TestCase):
     mock_k8s_api.assert_called_with(k8s_mocks.MOCK_API_CLIENT)
     mock_k8s_api_func.assert_called_with(mock_namespace)
     # Assert returned pods correspond to provided response
-    self.assertEqual(
-        set(pod.name for pod in pods),
-        set(pod.metadata.name for pod in mock_pods.items))
+    self.assertEqual({pod.name for pod in pods}, _ExpectedNames(5))
 
 
 class K8sNodeTest(unittest.TestCase):
@@ -112,9 +115,7 @@ class K8sNodeTest(unittest.TestCase):
     self.assertIn('field_selector', kwargs)
     self.assertIn('fake-node-name', kwargs['field_selector'])
     # Assert returned pods correspond to provided response
-    self.assertEqual(
-        set(pod.name for pod in pods),
-        set(pod.metadata.name for pod in mock_pods.items))
+    self.assertEqual({pod.name for pod in pods}, _ExpectedNames(5))
 
 
 class K8sPodTest(unittest.TestCase):
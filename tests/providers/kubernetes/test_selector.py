@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test on Kubernetes selectors."""
+
+import typing
+import unittest
+
+from libcloudforensics.providers.kubernetes import selector
+
+
+class K8sSelectorTest(unittest.TestCase):
+  """Test K8sSelector keyword building."""
+
+  @typing.no_type_check
+  def testToKeywordsDropsDuplicates(self):
+    """Test that duplicate components appear once in the built keywords."""
+    built = selector.K8sSelector(
+        selector.K8sSelector.Label('app', 'nginx'),
+        selector.K8sSelector.Label('app', 'nginx'),
+        selector.K8sSelector.Label('env', 'prod'))
+    self.assertEqual(
+        {'label_selector': 'app=nginx,env=prod'}, built.ToKeywords())
+
+  @typing.no_type_check
+  def testToKeywordsMixedComponents(self):
+    """Test that field and label components group under their keywords."""
+    built = selector.K8sSelector(
+        selector.K8sSelector.Node('fake-node-name'),
+        selector.K8sSelector.Running(),
+        selector.K8sSelector.Running(),
+        selector.K8sSelector.Label('app', 'nginx'))
+    self.assertEqual(
+        {
+            'field_selector':
+                'spec.nodeName=fake-node-name,'
+                'status.phase!=Failed,status.phase!=Succeeded',
+            'label_selector': 'app=nginx'
+        }, built.ToKeywords())
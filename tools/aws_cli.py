@@ -24,6 +24,7 @@ import json
 import os
 
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from libcloudforensics.providers.aws.internal import account
@@ -39,6 +40,24 @@ logger = logging_utils.GetLogger(__name__)
 if TYPE_CHECKING:
   import argparse
 
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+@lru_cache(maxsize=128)
+def _ParseTimestamp(timestamp: str) -> datetime:
+  """Parse a timestamp of the form 'YYYY-MM-DD HH:MM:SS'.
+
+  strptime re-interprets the format string on every call, so parsed
+  timestamps are cached for repeated invocations with the same value.
+
+  Args:
+    timestamp (str): The timestamp to parse.
+
+  Returns:
+    datetime: The parsed timestamp.
+  """
+  return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+
 
 def ListInstances(args: 'argparse.Namespace') -> None:
   """List EC2 instances in AWS account.
@@ -108,9 +127,9 @@ def QueryLogs(args: 'argparse.Namespace') -> None:
   if args.filter:
     params['qfilter'] = args.filter
   if args.start:
-    params['starttime'] = datetime.strptime(args.start, '%Y-%m-%d %H:%M:%S')
+    params['starttime'] = _ParseTimestamp(args.start)
   if args.end:
-    params['endtime'] = datetime.strptime(args.end, '%Y-%m-%d %H:%M:%S')
+    params['endtime'] = _ParseTimestamp(args.end)
 
   result = ct.LookupEvents(**params)
 